@@ -28,7 +28,6 @@ from peekingduck.commands import LOGGER_NAME
 from peekingduck.runner import Runner
 from peekingduck.utils.deprecation import deprecate
 from peekingduck.utils.logger import LoggerSetup
-from peekingduck.viewer import Viewer
 
 logger = logging.getLogger(LOGGER_NAME)  # pylint: disable=invalid-name
 
@@ -102,6 +101,10 @@ def run(  # pylint: disable=too-many-arguments
     pipeline_config_path = Path(config_path)
 
     if viewer:
+        # Defer tkinter and PIL imports to when the viewer is actually launched
+        # pylint: disable=import-outside-toplevel
+        from peekingduck.viewer import Viewer
+
         logger.info("Launching PeekingDuck Viewer")
         start_time = perf_counter()
         pkd_viewer = Viewer(
@@ -14,29 +14,67 @@
 
 """Implements the PeekingDuck Pipeline PlayList class"""
 
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 import logging
+import os
+import re
 import yaml
 
+try:  # use libyaml C parser/emitter if PyYAML is built with it
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 
 # Globals
 PKD_CONFIG_DIR = ".peekingduck"
 PKD_PLAYLIST_FILE = "playlist.yml"
+SortKey = Tuple[Tuple[Union[int, str], ...], str]
+
+
+def natural_sort_key(text: str) -> Tuple[Union[int, str], ...]:
+    """Split text into runs of digits and non-digits, so that numbers embedded
+    in names are compared as numbers and letters are compared case-insensitively,
+    e.g. "pipeline2.yml" sorts before "pipeline10.yml".
+
+    Args:
+        text (str): text to convert
+
+    Returns:
+        Tuple[Union[int, str], ...]: natural sort key of text
+    """
+    return tuple(
+        int(token) if token.isdecimal() else token.lower()
+        for token in re.split(r"(\d+)", text)
+    )
 
 
 class PipelineStats:
     """Implements immutable PipelineStats class to store pipeline-related information."""
 
+    __slots__ = (
+        "_hash",
+        "_pipeline",
+        "_name",
+        "_sort_key",
+        "_datetime",
+        "_datetime_str",
+    )
+
     def __init__(self, pipeline: str) -> None:
         self._hash = hash(pipeline)
         self._pipeline = pipeline
         pipeline_path = Path(pipeline)
         self._name = pipeline_path.name
-        self._datetime = (
-            pipeline_path.stat().st_mtime if pipeline_path.exists() else None
-        )
+        self._sort_key: SortKey = (natural_sort_key(self._name), self._pipeline)
+        # single stat() call instead of exists() then stat()
+        try:
+            self._datetime: Optional[float] = pipeline_path.stat().st_mtime
+        except OSError:
+            self._datetime = None
+        self._datetime_str: Optional[str] = None  # formatted on first use
 
     def __eq__(self, obj: "PipelineStats") -> bool:
         return self._pipeline == obj._pipeline
@@ -45,7 +83,7 @@ class PipelineStats:
         return self._hash
 
     def __lt__(self, obj: "PipelineStats") -> bool:
-        return (self._name, self._pipeline) < (obj._name, obj._pipeline)
+        return self._sort_key < obj._sort_key
 
     def __repr__(self) -> str:
         return self._pipeline
@@ -57,9 +95,13 @@ class PipelineStats:
         Returns:
             str: Last modified date/time string.
         """
-        if self._datetime:
-            return datetime.fromtimestamp(self._datetime).strftime("%Y-%m-%d-%H:%M:%S")
-        return ""
+        if self._datetime_str is None:
+            self._datetime_str = (
+                datetime.fromtimestamp(self._datetime).strftime("%Y-%m-%d-%H:%M:%S")
+                if self._datetime
+                else ""
+            )
+        return self._datetime_str
 
     @property
     def name(self) -> str:
@@ -70,6 +112,16 @@ class PipelineStats:
         """
         return self._name
 
+    @property
+    def sort_key(self) -> SortKey:
+        """Get key for sorting pipelines by natural order of name, then by full
+        path name.
+
+        Returns:
+            SortKey: Sort key of pipeline.
+        """
+        return self._sort_key
+
     @property
     def pipeline(self) -> str:
         """Get pipeline full path name.
@@ -93,31 +145,19 @@ class PlayList:
         self.logger.debug(f"playlist_path={self._playlist_path}")
         self.load_playlist_file()
 
-    def __iter__(self) -> "PlayList":
-        self._iter_idx = -1
-        return self
-
-    def __next__(self) -> PipelineStats:
-        self._iter_idx += 1
-        if self._iter_idx < len(self.pipeline_stats):
-            return self.pipeline_stats[self._iter_idx]
-        raise StopIteration
+    def __iter__(self) -> Iterator[PipelineStats]:
+        return iter(self._pipelines_dict.values())
 
     def __contains__(self, item: str) -> bool:
         if not isinstance(item, str):
             item = str(item)
-        res = False
-        for pipeline_stats in self.pipeline_stats:
-            if pipeline_stats.pipeline == item:
-                res = True
-                break
-        return res
+        return item in self._pipelines_dict
 
     def __getitem__(self, key: str) -> PipelineStats:
         return self._pipelines_dict[key]
 
     def __len__(self) -> int:
-        return len(self.pipeline_stats)
+        return len(self._pipelines_dict)
 
     #
     # Internal methods
@@ -128,13 +168,15 @@ class PlayList:
         Returns:
             List[str]: contents of playlist file, a list of pipelines
         """
-        if not Path.exists(self._playlist_path):
+        # open directly instead of checking if file exists first, and read bytes as
+        # yaml detects the encoding itself
+        try:
+            with open(self._playlist_path, "rb") as file:
+                playlist = yaml.load(file, Loader=SafeLoader)
+        except FileNotFoundError:
             self.logger.debug(f"{self._playlist_path} not found")
             return []
 
-        with open(self._playlist_path, "r", encoding="utf-8") as file:
-            playlist = yaml.safe_load(file)
-
         return playlist["playlist"]
 
     #
@@ -151,9 +193,8 @@ class PlayList:
         if pipeline_str in self:
             self.logger.info(f"{pipeline_str} already in playlist")
             return
-        pipeline_stats = PipelineStats(pipeline_str)
-        self.pipeline_stats.append(pipeline_stats)
-        self._pipelines_dict[pipeline_str] = pipeline_stats
+        self._pipelines_dict[pipeline_str] = PipelineStats(pipeline_str)
+        self._is_dirty = True
 
     def delete_pipeline(self, pipeline_path: Union[Path, str]) -> None:
         """Delete pipeline yaml file from playlist.
@@ -162,26 +203,35 @@ class PlayList:
         Args:
             pipeline_path (Union[Path, str]): path of yaml file to delete
         """
-        pipeline_str = str(pipeline_path)
-        if pipeline_str in self:
-            pipeline_stats = PipelineStats(pipeline_str)
-            self.pipeline_stats.remove(pipeline_stats)
-            self._pipelines_dict.pop(pipeline_str)
+        if self._pipelines_dict.pop(str(pipeline_path), None):
+            self._is_dirty = True
 
     def load_playlist_file(self) -> None:
         """Load playlist file"""
         pipelines = self._read_playlist_file()
-        self.pipeline_stats: List[PipelineStats] = []
-        self._pipelines_dict: Dict[str, PipelineStats] = {}
-        for pipeline in pipelines:
-            self.add_pipeline(pipeline)
+        # dict keeps pipelines in insertion order with O(1) lookup and delete,
+        # duplicate entries in playlist file are dropped before creating stats
+        self._pipelines_dict: Dict[str, PipelineStats] = {
+            pipeline: PipelineStats(pipeline)
+            for pipeline in dict.fromkeys(map(str, pipelines))
+        }
+        self._is_dirty = False  # True if playlist changed since last load/save
 
     def save_playlist_file(self) -> None:
-        """Save playlist file"""
+        """Save playlist file, if playlist has changed since it was last loaded
+        or saved"""
+        if not self._is_dirty:
+            self.logger.debug("playlist unchanged, not saving")
+            return
         # construct playlist contents with full pathnames
-        playlist = [str(stats) for stats in self.pipeline_stats]
+        playlist = list(self._pipelines_dict)
         playlist_dict = {"playlist": playlist}
         self.logger.debug(f"playlist_dict={playlist_dict}")
 
-        with open(self._playlist_path, "w", encoding="utf8") as file:
-            yaml.dump(playlist_dict, file)
+        # write to temp file then rename, so that playlist file is never left
+        # partially written, e.g. if viewer is killed while saving
+        contents = yaml.dump(playlist_dict, Dumper=SafeDumper)
+        tmp_path = self._playlist_path.with_suffix(".tmp")
+        tmp_path.write_text(contents, encoding="utf8")
+        os.replace(tmp_path, self._playlist_path)
+        self._is_dirty = False
@@ -14,11 +14,14 @@
 
 """Implements the PlayList single-column list view class"""
 
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, List, Union
+from operator import attrgetter
+import bisect
 import logging
 import tkinter as tk
 from tkinter import ttk
 from peekingduck.viewer.playlist import PipelineStats, PlayList
+from peekingduck.viewer.viewer_utils import set_grid_columns_weight
 
 OP_LIST = ["add", "delete", "run"]  # Supported GUI operations
 PLAYLIST_WIDTH = 200
@@ -96,13 +99,18 @@ class SingleColumnPlayListView:  # pylint: disable=too-few-public-methods, too-m
         )
         self._info_path.grid(row=3, column=1, sticky="nw")
 
-        num_col, _ = info_frm.grid_size()  # config column sizes
-        for i in range(num_col):
-            info_frm.grid_columnconfigure(i, weight=1)
+        set_grid_columns_weight(info_frm)  # config column sizes
 
         # listbox
+        # Tk technotes: exportselection=0 stops listbox from exporting its
+        # selection to the X selection (and losing it when another widget
+        # grabs the selection)
         playlist_listbox = tk.Listbox(
-            master=self.root, relief=tk.RIDGE, borderwidth=1, height=20
+            master=self.root,
+            relief=tk.RIDGE,
+            borderwidth=1,
+            height=20,
+            exportselection=0,
         )
         playlist_listbox.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         playlist_listbox.bind("<<ListboxSelect>>", self.selection_changed)
@@ -110,22 +118,53 @@ class SingleColumnPlayListView:  # pylint: disable=too-few-public-methods, too-m
 
     def redraw_view(self) -> None:
         """Populate playlist contents"""
-        self.sorted_playlist = sorted(self.playlist, reverse=self._sort_desc)
-        self._pipeline_to_index_map: Dict[str, int] = {}
-        self._index_to_stats_map: Dict[int, PipelineStats] = {}
+        self.sorted_playlist = sorted(
+            self.playlist, key=attrgetter("sort_key"), reverse=self._sort_desc
+        )
+        self._fill_listbox()
+
+    def _fill_listbox(self) -> None:
+        """Fill listbox with sorted playlist contents"""
+        self._update_index_maps()
+        names: List[str] = [stats.name for stats in self.sorted_playlist]
         self.tk_listbox.delete(0, tk.END)
+        # Tk technotes: insert all entries with a single Tk call instead of
+        #               one call per entry
+        self.tk_listbox.insert(tk.END, *names)
+        if len(self._tk_fg_system) == 0:
+            # save platform specific foreground color
+            self._tk_fg_system = self.tk_listbox["fg"]
+            self.logger.debug(f"saving system foreground='{self._tk_fg_system}'")
         for i, stats in enumerate(self.sorted_playlist):
-            self._pipeline_to_index_map[stats.pipeline] = i
-            self._index_to_stats_map[i] = stats
-            self.tk_listbox.insert(i, stats.name)
-            if len(self._tk_fg_system) == 0:
-                # save platform specific foreground color
-                self._tk_fg_system = self.tk_listbox["fg"]
-                self.logger.debug(f"saving system foreground='{self._tk_fg_system}'")
             if len(stats.datetime) == 0:
                 self.tk_listbox.itemconfig(i, {"fg": "red"})  # mark as error
         self.header["text"] = f"Pipelines: {'v' if self._sort_desc else '^'}"
 
+    def _update_index_maps(self) -> None:
+        """Map pipelines to listbox indices and vice versa, based on sorted playlist"""
+        self._pipeline_to_index_map: Dict[str, int] = {}
+        self._index_to_stats_map: Dict[int, PipelineStats] = {}
+        for i, stats in enumerate(self.sorted_playlist):
+            self._pipeline_to_index_map[stats.pipeline] = i
+            self._index_to_stats_map[i] = stats
+
+    def _insert_entry(self, stats: PipelineStats) -> None:
+        """Insert new pipeline into listbox at its sorted position, instead of
+        redrawing the whole listbox.  Index maps are not updated here.
+
+        Args:
+            stats (PipelineStats): the pipeline to insert
+        """
+        keys = [entry.sort_key for entry in self.sorted_playlist]
+        if self._sort_desc:
+            i = len(keys) - bisect.bisect_left(keys[::-1], stats.sort_key)
+        else:
+            i = bisect.bisect_right(keys, stats.sort_key)
+        self.sorted_playlist.insert(i, stats)
+        self.tk_listbox.insert(i, stats.name)
+        if len(stats.datetime) == 0:
+            self.tk_listbox.itemconfig(i, {"fg": "red"})  # mark as error
+
     def get_selected_index(self) -> int:
         """Return index of selected listbox entry
 
@@ -194,7 +233,10 @@ class SingleColumnPlayListView:  # pylint: disable=too-few-public-methods, too-m
         """
         self.logger.debug("btn_add_press")
         if self._callback["add"]():
-            self.redraw_view()
+            for stats in self.playlist:
+                if stats.pipeline not in self._pipeline_to_index_map:
+                    self._insert_entry(stats)
+            self._update_index_maps()
 
     def btn_delete_press(
         self, event: tk.Event  # pylint: disable=unused-argument
@@ -208,7 +250,10 @@ class SingleColumnPlayListView:  # pylint: disable=too-few-public-methods, too-m
         stats = self._index_to_stats_map[i]
         self.logger.debug(f"btn_delete_press: {stats.pipeline}")
         if self._callback["delete"](pipeline=stats.pipeline):
-            self.redraw_view()
+            # Tk technotes: delete only this entry, other entries keep their colors
+            del self.sorted_playlist[i]
+            self.tk_listbox.delete(i)
+            self._update_index_maps()
 
     def btn_run_press(self, event: tk.Event) -> None:  # pylint: disable=unused-argument
         """Callback to handle "Run" button
@@ -228,7 +273,10 @@ class SingleColumnPlayListView:  # pylint: disable=too-few-public-methods, too-m
             event (tk.Event): Tk event object.
         """
         self._sort_desc = not self._sort_desc
-        self.redraw_view()
+        # sort keys are unique, so reversing gives the other sort order without
+        # sorting again
+        self.sorted_playlist.reverse()
+        self._fill_listbox()
         self.show_selected_pipeline()
 
     def selection_changed(
@@ -16,27 +16,35 @@
 Implement PeekingDuck Viewer
 """
 
-from typing import List
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
 from contextlib import redirect_stderr
 from pathlib import Path
 import logging
-from io import StringIO
+from io import BytesIO, StringIO
 import os
 import platform
 import traceback
 import tkinter as tk
 from tkinter import filedialog
 from tkinter.messagebox import askyesno, showerror
+import queue
 import threading
-import copy
+from time import perf_counter
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
 from peekingduck.declarative_loader import DeclarativeLoader
 from peekingduck.pipeline.pipeline import Pipeline
 from peekingduck.viewer.playlist import PlayList
-from peekingduck.viewer.viewer_gui import create_window
+from peekingduck.viewer.viewer_gui import (
+    WIN_HEIGHT,
+    WIN_WIDTH,
+    create_playlist_view,
+    create_window,
+)
 from peekingduck.viewer.viewer_utils import (
+    KEY_STATE_CTRL,
     get_keyboard_char,
     get_keyboard_modifier,
 )
@@ -46,11 +54,22 @@ from peekingduck.viewer.viewer_utils import (
 ####################
 BUTTON_DELAY: int = 250  # milliseconds (0.25 of a second)
 BUTTON_REPEAT: int = int(1000 / 60)  # milliseconds (60 fps)
-STOP_PIPELINE_DELAY: float = 2.0  # seconds before switching pipelines
+STOP_PIPELINE_DELAY: float = 2.0  # seconds to let stopped pipeline clean up
 FPS_60: int = int(1000 / 60)  # milliseconds per iteration
+SLIDER_REDRAW_DELAY: int = FPS_60  # milliseconds to coalesce slider redraws
+TIMER_IDLE_DELAY: int = 200  # milliseconds between timer ticks when nothing to poll
+SLIDER_UPDATE_INTERVAL: float = 0.1  # seconds between slider updates during playback
 ZOOM_TEXT: List[str] = ["50%", "75%", "100%", "125%", "150%", "200%", "250%", "300%"]
 ZOOM_DEFAULT_IDX: int = 2
 ZOOMS: List[float] = [0.5, 0.75, 1.0, 1.25, 1.50, 2.00, 2.50, 3.00]  # > 3x is slow!
+FRAME_QUEUE_SIZE: int = 8  # max frames pending display from pipeline worker
+FRAME_QUEUE_TIMEOUT: float = 0.1  # seconds to wait for space in frame queue
+# frames larger than window at max zoom are shrunk before saving for playback
+MAX_FRAME_HEIGHT: int = int(WIN_HEIGHT * ZOOMS[-1])
+MAX_FRAME_WIDTH: int = int(WIN_WIDTH * ZOOMS[-1])
+FRAME_JPEG_QUALITY: int = 90  # quality of compressed frames saved for playback
+MAX_SAVED_FRAMES: int = 3000  # oldest frames are dropped beyond this many
+ZOOM_CACHE_SIZE: int = 16  # number of most recently shown images to keep
 PLAY_BUTTON_TEXT = "Play"
 STOP_BUTTON_TEXT = "Stop"
 
@@ -70,6 +89,54 @@ def parse_streams(io_stream: StringIO) -> str:
     return msg
 
 
+def shrink_frame(frame: np.ndarray) -> np.ndarray:
+    """Helper method to shrink a frame, keeping its aspect ratio, if it is larger
+    than the window at maximum zoom. Such frames can never be seen in full, so
+    this saves memory and all subsequent work on the frame.
+
+    Args:
+        frame (np.ndarray): the frame to shrink
+
+    Returns:
+        np.ndarray: the shrunk frame, or the original frame if it is small enough
+    """
+    height, width = frame.shape[:2]
+    scale = min(MAX_FRAME_HEIGHT / height, MAX_FRAME_WIDTH / width)
+    if scale < 1.0:
+        new_size = (int(width * scale), int(height * scale))
+        frame = cv2.resize(frame, new_size, interpolation=cv2.INTER_AREA)
+    return frame
+
+
+def encode_frame(frame: np.ndarray) -> bytes:
+    """Helper method to compress a frame into JPEG bytes.
+    Used to keep memory usage of frames saved for playback low.
+
+    Args:
+        frame (np.ndarray): the BGR frame to compress
+
+    Returns:
+        bytes: JPEG encoded frame
+    """
+    _, buffer = cv2.imencode(
+        ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, FRAME_JPEG_QUALITY]
+    )
+    return buffer.tobytes()
+
+
+def decode_frame(frame_bytes: bytes) -> Image.Image:
+    """Helper method to decompress a frame compressed by encode_frame().
+    The JPEG decoder outputs RGB directly, so no BGR -> RGB conversion is needed.
+
+    Args:
+        frame_bytes (bytes): JPEG encoded frame
+
+    Returns:
+        Image.Image: the RGB image, decoded lazily when its pixels are accessed
+    """
+    return Image.open(BytesIO(frame_bytes))
+
+
 class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Implement PeekingDuck Viewer class"""
 
@@ -99,11 +166,25 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             "-": self._zoom_out,
         }
         # forward type hinting of internal working vars
-        self._frames: List[np.ndarray] = []
+        self._frames: Deque[bytes] = deque(maxlen=MAX_SAVED_FRAMES)
+        self._frames_dropped: int = 0
         self._frame_idx: int = -1
+        self._zoom_cache: "OrderedDict[Tuple[int, int, bool], Image.Image]" = (
+            OrderedDict()
+        )
+        self._img_tk: Optional[ImageTk.PhotoImage] = None
         self.zoom_idx: int = ZOOM_DEFAULT_IDX
         self.is_output_playback: bool = False
         self.is_pipeline_running: bool = False
+        self._pipeline_thread: Optional[threading.Thread] = None
+        self._frame_ready_pipe: Optional[Tuple[int, int]] = None
+        self._playback_interval: int = FPS_60
+        self._playback_job: Optional[str] = None
+        self._playback_deadline: float = 0.0
+        self._slider_update_due: float = 0.0
+        self._show_frame_job: Optional[str] = None
+        self._switch_pipeline_job: Optional[str] = None
+        self._pending_pipeline: Optional[str] = None
         self.state: str = "play"
 
     def run(self) -> None:
@@ -142,6 +223,8 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             self.tk_playlist_frm.pack_forget()
         else:
             self.tk_playlist_frm.pack(side=tk.RIGHT, fill=tk.Y)
+            if self.tk_playlist_view is None:
+                create_playlist_view(self)  # deferred from startup as initially hidden
             self.tk_playlist_view.reset()
             self.tk_playlist_view.select(str(self.pipeline_full_path))
         self.playlist_show = not self.playlist_show
@@ -169,18 +252,24 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """Handle viewer quit event"""
         self.logger.info("quitting viewer")
 
-        if self.is_pipeline_running or self.is_output_playback:
+        self._pending_pipeline = None
+        if self.is_pipeline_running:
             self.logger.debug("stopping current pipeline")
-            if self.is_pipeline_running:
+            self.stop_running_pipeline()
+            # pipeline can only be cleaned up once worker has finished its iteration
+            if self._join_pipeline_worker(STOP_PIPELINE_DELAY):
                 self.run_pipeline_end()
-            elif self.is_output_playback:
-                self.stop_playback()
-
-            # add non-blocking wait to let background task clean up properly
-            self.logger.debug(f"wait {STOP_PIPELINE_DELAY} sec")
-            wait_event = threading.Event()
-            wait_event.wait(STOP_PIPELINE_DELAY)
+                # add non-blocking wait to let background task clean up properly
+                self.logger.debug(f"wait {STOP_PIPELINE_DELAY} sec")
+                wait_event = threading.Event()
+                wait_event.wait(STOP_PIPELINE_DELAY)
+            else:
+                self.logger.warning("pipeline did not stop in time, quitting anyway")
+        elif self.is_output_playback:
+            self.stop_playback()
 
+        if self._switch_pipeline_job:
+            self.root.after_cancel(self._switch_pipeline_job)
         self.cancel_timer_function()
         self.logger.debug("saving playlist")
         self.playlist.save_playlist_file()
@@ -193,17 +282,22 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         Args:
             event (tk.Event): the key down event
         """
-        self.logger.debug(
-            f"keypressed: char={event.char}, keysym={event.keysym}, state={event.state}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"keypressed: char={event.char}, keysym={event.keysym}, "
+                f"state={event.state}"
+            )
         key_state: int = int(event.state)
-        mod = get_keyboard_modifier(key_state)
+        # all supported keyboard shortcuts use ctrl, ignore other keys right away
+        if not key_state & KEY_STATE_CTRL:
+            return
         key = get_keyboard_char(event.char, event.keysym)
-        self.logger.debug(f"mod={mod}, key={key}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"mod={get_keyboard_modifier(key_state)}, key={key}")
         # handle supported keyboard shortcuts here
-        if mod.startswith("ctrl"):
-            if key in self._keyboard_shortcuts:
-                self._keyboard_shortcuts[key]()
+        shortcut = self._keyboard_shortcuts.get(key)
+        if shortcut:
+            shortcut()
 
     def on_resize(self, event: tk.Event) -> None:
         """Handle window resize event.
@@ -213,9 +307,11 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """
         if str(event.widget) == ".":
             # NB: "." is the root widget, i.e. main window
-            self.logger.debug(
-                f"on_resize: widget={event.widget}, h={event.height}, w={event.width}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"on_resize: widget={event.widget}, "
+                    f"h={event.height}, w={event.width}"
+                )
 
     def on_add_pipeline(self) -> bool:
         """Add pipeline to playlist
@@ -261,15 +357,46 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         # run new pipeline
         self.logger.debug(f"on run pipeline {pipeline}")
         if self.is_pipeline_running:
-            self.run_pipeline_end()
-        elif self.is_output_playback:
+            # pipeline worker may be in the middle of a slow node, so only switch
+            # once it has finished and pipeline is cleaned up, cf. run_pipeline_end()
+            self._pending_pipeline = pipeline
+            self.stop_running_pipeline()
+            return
+        if self.is_output_playback:
             self.stop_playback()
+        self._schedule_switch_pipeline(pipeline)
+
+    def _schedule_switch_pipeline(self, pipeline: str) -> None:
+        """Schedule given pipeline to be started after STOP_PIPELINE_DELAY
 
-        # add non-blocking wait to let background task clean up properly
+        Args:
+            pipeline (str): Pipeline to execute
+        """
+        # let background task clean up properly without blocking GUI, restarting the
+        # delay if another pipeline is selected meanwhile
         self.logger.debug(f"wait {STOP_PIPELINE_DELAY} sec")
-        wait_event = threading.Event()
-        wait_event.wait(STOP_PIPELINE_DELAY)
+        self.cancel_timer_function()
+        if self._switch_pipeline_job:
+            self.root.after_cancel(self._switch_pipeline_job)
+        self._switch_pipeline_job = self.root.after(
+            int(STOP_PIPELINE_DELAY * 1000), self._switch_pipeline, pipeline
+        )
+
+    def _switch_pipeline(self, pipeline: str) -> None:
+        """Start given pipeline once previous pipeline has been stopped,
+        cf. on_run_pipeline()
 
+        Args:
+            pipeline (str): Pipeline to execute
+        """
+        self._switch_pipeline_job = None
+        # GUI stays usable while switch is pending: drop playback or redraw of the
+        # previous pipeline's frames started meanwhile
+        if self.is_output_playback:
+            self.stop_playback()
+        if self._show_frame_job:
+            self.root.after_cancel(self._show_frame_job)
+            self._show_frame_job = None
         # double check status variables
         self.logger.debug(f"self.state={self.state}")
         self.logger.debug(f"self.is_output_playback={self.is_output_playback}")
@@ -283,7 +410,6 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             )
 
         # start new pipeline here
-        self.cancel_timer_function()
         self.init_pipeline(Path(pipeline))
         self.timer_function()
 
@@ -294,21 +420,21 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     ##################
     def timer_function(self) -> None:
         """Function to do background processing in Tkinter's way"""
-        if self.state == "play":
-            # Only two states: 1) playing back video or 2) executing pipeline
-            if self.is_output_playback:
-                self.do_playback()
-            else:
-                # Executing pipeline: check which execution state we are in
-                if not self.is_pipeline_running:
-                    self.run_pipeline_start()
-                elif self._pipeline.terminate:
-                    self.run_pipeline_end()
-                else:
-                    self.run_pipeline_one_iteration()
-
-        self.root.update()  # wake up GUI
-        self._bkgd_job = self.tk_header.after(FPS_60, self.timer_function)
+        # Only two play states: 1) playing back video or 2) executing pipeline.
+        # Playback schedules itself at the video frame rate (cf. self.do_playback)
+        if self.state == "play" and not self.is_output_playback:
+            # Executing pipeline: check which execution state we are in
+            if not self.is_pipeline_running:
+                self.run_pipeline_start()
+            elif self._frame_ready_pipe is None:
+                # poll for frames if Tk file handler is not available
+                self._process_frame_queue()
+
+        # Only poll at frame rate when frames can arrive without a file handler,
+        # otherwise tick slowly to avoid needless wakeups while idle
+        is_polling = self.is_pipeline_running and self._frame_ready_pipe is None
+        delay = FPS_60 if is_polling else TIMER_IDLE_DELAY
+        self._bkgd_job = self.tk_header.after(delay, self.timer_function)
 
     def cancel_timer_function(self) -> None:
         """Cancel the background timer function"""
@@ -340,33 +466,58 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
     def _show_frame(self) -> None:
         """Display image frame pointed to by frame_idx"""
         if self._frames:
-            frame = self._frames[self._frame_idx]
-            frame = self._apply_zoom(frame)
-            # self.logger.debug(f"show_frame {self.frame_idx} size={frame.shape}")
-            img_arr = Image.fromarray(frame)
-            img_tk = ImageTk.PhotoImage(img_arr)
-            # self.logger.debug(f"img_tk: {img_tk.width()}x{img_tk.height()}")
-            self._img_tk = img_tk  # save to avoid python GC
-            self.tk_output_image.config(image=img_tk)
-
-    def _apply_zoom(self, frame: np.ndarray) -> np.ndarray:
+            # reuse cached image if this frame was recently shown at this zoom level
+            # resampling filter depends on play state (cf. _apply_zoom)
+            key = (self._frame_num(), self.zoom_idx, self.state == "play")
+            img_arr = self._zoom_cache.get(key)
+            if img_arr is None:
+                img_arr = self._apply_zoom(decode_frame(self._frames[self._frame_idx]))
+                img_arr.load()  # decode once and keep the pixels in the cache
+                # self.logger.debug(f"show_frame {self.frame_idx} size={img_arr.size}")
+                self._zoom_cache[key] = img_arr
+                if len(self._zoom_cache) > ZOOM_CACHE_SIZE:
+                    self._zoom_cache.popitem(last=False)  # evict least recently used
+            else:
+                self._zoom_cache.move_to_end(key)
+            # Tk technotes: replacing the image of a visible label every frame is slow,
+            #               so paste pixels into the existing image and only create a
+            #               new image when the image size changes, e.g. after zooming
+            img_tk = self._img_tk
+            if img_tk is None or (img_tk.width(), img_tk.height()) != img_arr.size:
+                img_tk = ImageTk.PhotoImage(img_arr)
+                # self.logger.debug(f"img_tk: {img_tk.width()}x{img_tk.height()}")
+                self._img_tk = img_tk  # save to avoid python GC
+                self.tk_output_image.config(image=img_tk)
+            else:
+                img_tk.paste(img_arr)
+
+    def _apply_zoom(self, img: Image.Image) -> Image.Image:
         """Zoom output image according to current zoom setting
 
         Args:
-            frame (np.ndarray): image frame data to be zoomed
+            img (Image.Image): decoded image frame to be zoomed
 
         Returns:
-            np.ndarray: the zoomed image
+            Image.Image: the zoomed image
         """
         if self.zoom_idx != ZOOM_DEFAULT_IDX:
             zoom = ZOOMS[self.zoom_idx]
-            new_size = (
-                int(frame.shape[0] * zoom),
-                int(frame.shape[1] * zoom),
-                frame.shape[2],
-            )
-            frame = cv2.resize(frame, (new_size[1], new_size[0]))
-        return frame
+            new_size = (int(img.width * zoom), int(img.height * zoom))
+            if zoom < 1.0:
+                # let JPEG decoder downscale as much as it can while decoding, then
+                # area average (box filter) the rest
+                img.draft("RGB", new_size)
+                resample = Image.BOX
+            elif self.state == "play":
+                # nearest neighbour keeps upscaling cheap while frames stream in
+                resample = Image.NEAREST
+            else:
+                # smoother upscaling when browsing frames, cost is paid once per
+                # frame thanks to zoom cache
+                resample = Image.BILINEAR
+            if img.size != new_size:
+                img = img.resize(new_size, resample)
+        return img
 
     def _zoom_in(self) -> None:
         """Zoom in on image"""
@@ -403,13 +554,26 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         """Change header text to pipeline pathname"""
         self.tk_header["text"] = f"{self.pipeline_path.name}"
 
+    def _frame_num(self) -> int:
+        """Frame number of current frame counted from start of pipeline, including
+        frames already dropped from the saved frames"""
+        return self._frames_dropped + self._frame_idx + 1
+
     def _update_slider_and_show_frame(self) -> None:
-        """Update slider based on frame index and show new frame"""
-        frame_num = self._frame_idx + 1
-        self.tk_scale.set(frame_num)
-        self.tk_lbl_frame_num["text"] = frame_num
+        """Update slider based on frame index and show new frame.
+        During playback, the slider and frame number are only updated once every
+        SLIDER_UPDATE_INTERVAL as they cannot be read at video frame rate anyway."""
+        now = perf_counter()
+        if not self.is_output_playback or now >= self._slider_update_due:
+            self._slider_update_due = now + SLIDER_UPDATE_INTERVAL
+            self._update_slider()
         self._show_frame()
 
+    def _update_slider(self) -> None:
+        """Update slider and frame number based on frame index"""
+        self.tk_scale.set(self._frame_idx + 1)
+        self.tk_lbl_frame_num["text"] = self._frame_num()
+
     def _enable_progress(self) -> None:
         """Show progress bar and hide slider"""
         self.logger.debug("enable progress")
@@ -422,7 +586,11 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         self.tk_progress.grid_remove()  # hide progress bar
         self.tk_scale.grid()  # show slider
         self.tk_scale.configure(from_=1, to=len(self._frames))
+        # playback at frame rate of input video, if known
+        fps = self._pipeline.data.get("saved_video_fps", 0)
+        self._playback_interval = int(1000 / fps) if fps > 0 else FPS_60
         self.sync_slider_to_frame(self.tk_scale.get())
+        self._show_frame_later()  # redraw even if frame unchanged, cf. _apply_zoom
 
     def _set_status_text(self, text: str) -> None:
         """Set the status bar text to given text string.
@@ -438,15 +606,32 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         Args:
             val (str): slider value
         """
-        self.logger.debug(f"sync slider to frame: {val} {type(val)}")
-        idx = int(self.tk_scale.get())
-        idx_start = self.tk_scale["from"]
-        idx_end = self.tk_scale["to"]
-        self.logger.debug(f"idx={idx}, from:{idx_start}, to:{idx_end})")
-        if idx >= len(self._frames):
-            idx = len(self._frames)
+        # slider events fire continuously while dragging, so use value passed in
+        # instead of querying Tk, and skip events that do not change frame
+        idx = min(int(float(val)), len(self._frames))
+        if idx - 1 == self._frame_idx:
+            return
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"sync slider to frame: {val} {type(val)}")
+            idx_start = self.tk_scale["from"]
+            idx_end = self.tk_scale["to"]
+            self.logger.debug(f"idx={idx}, from:{idx_start}, to:{idx_end})")
         self._frame_idx = idx - 1
-        self.tk_lbl_frame_num["text"] = idx
+        self.tk_lbl_frame_num["text"] = self._frame_num()
+        self._show_frame_later()
+
+    def _show_frame_later(self) -> None:
+        """Coalesce rapid redraw requests, e.g. many slider events from dragging the
+        slider, into at most one redraw per SLIDER_REDRAW_DELAY"""
+        if self._show_frame_job is None:
+            self._show_frame_job = self.root.after(
+                SLIDER_REDRAW_DELAY, self._show_frame_now
+            )
+        # else: pending redraw will show the latest frame_idx
+
+    def _show_frame_now(self) -> None:
+        """Show frame requested by _show_frame_later()"""
+        self._show_frame_job = None
         self._show_frame()
 
     ####################
@@ -476,25 +661,31 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         self.custom_nodes_parent_path = str(self.pipeline_full_path.parent / "src")
         self.logger.debug(f"custom nodes parent: {type(self.custom_nodes_parent_path)}")
         # init internal working vars
-        self._frames = []
+        self._frames = deque(maxlen=MAX_SAVED_FRAMES)
+        self._frames_dropped = 0
         self._frame_idx = -1
+        self._zoom_cache = OrderedDict()
         self.zoom_idx = ZOOM_DEFAULT_IDX
         self.is_output_playback = False
         self.is_pipeline_running = False
+        self._pipeline_thread = None
         self.state = "play"  # activate auto play (cf. self.timer_function)
         self.bkgd_job = None
 
-    def pipeline_error(self, exc_msg: str, err_stream: StringIO) -> None:
+    def pipeline_error(
+        self, exc_msg: str, err_stream: Optional[StringIO] = None
+    ) -> None:
         """Helper method to handle pipeline error conditions
 
         Args:
             exc_msg (str): message from exception object
-            err_stream (StringIO): error I/O stream
+            err_stream (Optional[StringIO]): error I/O stream, if captured
         """
         self.logger.error("Error when running pipeline:")
         self.logger.error(f"Exception msg: {exc_msg}")
-        err_msg = parse_streams(err_stream)
-        self.logger.error(f"Error msg: {err_msg}")
+        if err_stream is not None:
+            err_msg = parse_streams(err_stream)
+            self.logger.error(f"Error msg: {err_msg}")
         self.run_pipeline_end()
         self.set_viewer_state_to_stop()
         if "FileNotFoundError" in exc_msg:
@@ -506,9 +697,11 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             showerror("CUDA Runtime Error", "Please see logs for more details")
 
     def run_pipeline_end(self) -> None:
-        """Called when pipeline execution is completed.
-        To perform clean-up/housekeeping tasks to ensure system consistency"""
+        """Called when pipeline execution is completed, after pipeline worker thread
+        has finished. To perform clean-up/housekeeping tasks to ensure system
+        consistency"""
         self.logger.debug("run pipeline end")
+        self._join_pipeline_worker()
         for node in self._pipeline.nodes:
             if node.name.endswith("input.visual"):
                 node.release_resources()  # clean up nodes with threads
@@ -516,72 +709,281 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
         self._enable_slider()
         self.set_viewer_state_to_stop()
         self._set_header_stop()
+        if self._pending_pipeline:
+            pipeline, self._pending_pipeline = self._pending_pipeline, None
+            self._schedule_switch_pipeline(pipeline)
 
-    def run_pipeline_one_iteration(self) -> None:  # pylint: disable=too-many-branches
-        """Run one pipeline iteration"""
-        self.is_pipeline_running = True
-        err_runtime = False
-        exc_msg = ""
-        err_stream = StringIO()
-        # technote: Detect runtime exception with flag as exception object holds ref to
-        # error stack frame, preventing further objects from being freed.
-        with redirect_stderr(err_stream):
+    def run_pipeline_one_iteration(self) -> Optional[np.ndarray]:
+        """Run one pipeline iteration.
+        Called from the pipeline worker thread, so must not access any Tk widget.
+
+        Returns:
+            Optional[np.ndarray]: BGR output frame for display, None if no output
+        """
+        data = self._pipeline.data
+        for node_idx, (node, is_all, is_end, optional_inputs) in enumerate(
+            self._exec_plan
+        ):
+            if data.get("pipeline_end", False):
+                self._pipeline.terminate = True
+                if not is_end:
+                    continue
+            if is_all:
+                # shallow copy: nodes get their own dict but share the data items
+                inputs = data.copy()
+            else:
+                inputs = self._get_node_inputs(node_idx, node.inputs)
+            # Nodes won't receive inputs with optional key if not found upstream
+            for key in optional_inputs:
+                if key in data:
+                    inputs[key] = data[key]
+            data.update(node.run(inputs))
+
+        return data["img"]
+
+    def _make_exec_plan(self) -> List[Tuple[Any, bool, bool, Tuple[str, ...]]]:
+        """Work out once per pipeline how each node is to be run, instead of
+        inspecting every node on every iteration.
+
+        Returns:
+            List[Tuple[Any, bool, bool, Tuple[str, ...]]]: for each node to run,
+            (node, takes all inputs, takes pipeline_end, optional inputs)
+        """
+        return [
+            (
+                node,
+                "all" in node.inputs,
+                "pipeline_end" in node.inputs,
+                tuple(getattr(node, "optional_inputs", ())),
+            )
+            for node in self._pipeline.nodes
+            # disable duplicate video from output.screen
+            if not node.name.endswith("output.screen")
+        ]
+
+    def _get_node_inputs(self, node_idx: int, keys: List[str]) -> Dict[str, Any]:
+        """Get node inputs from pipeline data, skipping keys not found in data.
+
+        Technotes: pipeline data keys are only ever added, never removed, so the
+        input keys found in data only change when the number of data keys changes.
+        They are cached per node until then, to avoid rechecking every key on every
+        iteration.
+
+        Args:
+            node_idx (int): index of node in execution plan
+            keys (List[str]): input keys of node
+
+        Returns:
+            Dict[str, Any]: node inputs
+        """
+        data = self._pipeline.data
+        num_data_keys, found_keys = self._node_input_keys.get(node_idx, (-1, ()))
+        if num_data_keys != len(data):
+            found_keys = tuple(key for key in keys if key in data)
+            self._node_input_keys[node_idx] = (len(data), found_keys)
+        return dict(zip(found_keys, map(data.__getitem__, found_keys)))
+
+    def run_pipeline_worker(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        frame_queue: "queue.Queue[bytes]",
+        stop_event: threading.Event,
+        done_event: threading.Event,
+        wake_fd: Optional[int],
+    ) -> None:
+        """Pipeline worker thread: run pipeline iterations until pipeline terminates
+        and pass output frames to the Tk main thread via the frame queue.
+        Frames are JPEG compressed here to keep the work off the Tk main thread.
+
+        Technotes: the worker loop uses the pipeline, frame queue and wake up pipe
+        passed in, but run_pipeline_one_iteration() also reads self._pipeline,
+        self._exec_plan and self._node_input_keys, and a runtime error is passed
+        back in self._pipeline_err. These are only safe to share because the Tk
+        main thread does not reassign them (in run_pipeline_start()), clean up the
+        pipeline or close the pipe until the worker has finished, which is
+        signalled by setting done_event last. Keep it that way when changing how
+        pipelines are stopped or switched.
+
+        Args:
+            pipeline (Pipeline): the pipeline to run
+            frame_queue (queue.Queue[bytes]): queue of encoded output frames
+            stop_event (threading.Event): set by Tk main thread to stop the worker
+            done_event (threading.Event): set by worker when it has finished
+            wake_fd (Optional[int]): write end of frame ready pipe, if any
+        """
+        try:
+            while not pipeline.terminate:
+                err_runtime = False
+                exc_msg = ""
+                # technote: Detect runtime exception with flag as exception object
+                # holds ref to error stack frame, preventing further objects from
+                # being freed. Node stderr is not captured with redirect_stderr()
+                # here as it replaces sys.stderr for all threads, which would also
+                # swallow errors from the Tk main thread.
+                try:
+                    frame = self.run_pipeline_one_iteration()
+                except Exception:  # pylint: disable=broad-except
+                    err_runtime = True
+                    exc_msg = traceback.format_exc()
+
+                # pipeline runtime error is handled by Tk main thread
+                if err_runtime:
+                    self._pipeline_err = exc_msg
+                    break
+                if frame is not None:
+                    self._put_frame_queue(
+                        frame_queue,
+                        stop_event,
+                        wake_fd,
+                        encode_frame(shrink_frame(frame)),
+                    )
+        finally:
+            done_event.set()
+            self._notify_frame_ready(wake_fd)
+
+    @staticmethod
+    def _notify_frame_ready(wake_fd: Optional[int]) -> None:
+        """Wake up Tk main thread by writing to the frame ready pipe, if any.
+        Called from the pipeline worker thread.
+
+        Args:
+            wake_fd (Optional[int]): write end of frame ready pipe
+        """
+        if wake_fd is not None:
             try:
-                for node in self._pipeline.nodes:
-                    if self._pipeline.data.get("pipeline_end", False):
-                        self._pipeline.terminate = True
-                        if "pipeline_end" not in node.inputs:
-                            continue
-                    if "all" in node.inputs:
-                        inputs = copy.deepcopy(self._pipeline.data)
-                    else:
-                        inputs = {
-                            key: self._pipeline.data[key]
-                            for key in node.inputs
-                            if key in self._pipeline.data
-                        }
-                    if hasattr(node, "optional_inputs"):
-                        # Nodes won't receive inputs with optional key if not found upstream
-                        for key in node.optional_inputs:
-                            if key in self._pipeline.data:
-                                inputs[key] = self._pipeline.data[key]
-                    if node.name.endswith("output.screen"):
-                        pass  # disable duplicate video from output.screen
-                    else:
-                        outputs = node.run(inputs)
-                        self._pipeline.data.update(outputs)
-                    # check for FPS on first iteration
-                    if self._frame_idx == 0 and node.name.endswith("input.visual"):
-                        num_frames = node.total_frame_count
-                        if num_frames > 0:
-                            self.tk_progress["maximum"] = num_frames
-                        else:
-                            self.tk_progress["mode"] = "indeterminate"
-            except Exception:  # pylint: disable=broad-except
-                err_runtime = True
-                exc_msg = traceback.format_exc()
+                os.write(wake_fd, b"\0")
+            except BlockingIOError:
+                pass  # pipe full: Tk already has a pending wake up
 
-        # handle pipeline runtime error
-        if err_runtime:
-            self.pipeline_error(exc_msg, err_stream)
-            return
+    def _on_frame_ready(
+        self, file_desc: int, mask: int  # pylint: disable=unused-argument
+    ) -> None:
+        """Tk file handler: called by Tk event loop when pipeline worker has queued
+        a frame, so frames are processed as soon as they are produced.
 
-        # render img into screen output to Tkinter
-        img = self._pipeline.data["img"]
-        if img is not None:
-            frame = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)  # BGR -> RGB for Tkinter
-            self._frames.append(frame)  # save frame for playback
-            self._frame_idx += 1
+        Args:
+            file_desc (int): read end of frame ready pipe
+            mask (int): Tk file event mask
+        """
+        try:
+            os.read(file_desc, 4096)  # clear all pending wake ups
+        except BlockingIOError:
+            pass
+        if self.is_pipeline_running:
+            self._process_frame_queue()
+
+    def _create_frame_ready_pipe(self) -> None:
+        """Create pipe for pipeline worker thread to wake up Tk event loop.
+        Tk file handlers are not supported on Windows, where Tk timer polling is
+        used instead (cf. self.timer_function)."""
+        self._frame_ready_pipe = None
+        if hasattr(self.root.tk, "createfilehandler"):
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_frame_ready)
+            self._frame_ready_pipe = (read_fd, write_fd)
+
+    def _delete_frame_ready_pipe(self) -> None:
+        """Remove Tk file handler and close frame ready pipe.
+        Must only be called once pipeline worker using the pipe has finished."""
+        if self._frame_ready_pipe is not None:
+            read_fd, write_fd = self._frame_ready_pipe
+            self._frame_ready_pipe = None
+            self.root.tk.deletefilehandler(read_fd)
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def _put_frame_queue(
+        self,
+        frame_queue: "queue.Queue[bytes]",
+        stop_event: threading.Event,
+        wake_fd: Optional[int],
+        frame: bytes,
+    ) -> None:
+        """Put frame into frame queue, blocking while queue is full to throttle the
+        pipeline worker. Give up if pipeline is stopped by the Tk main thread.
+
+        Args:
+            frame_queue (queue.Queue[bytes]): queue of encoded output frames
+            stop_event (threading.Event): set by Tk main thread to stop the worker
+            wake_fd (Optional[int]): write end of frame ready pipe, if any
+            frame (bytes): encoded frame to queue
+        """
+        while True:
+            try:
+                frame_queue.put(frame, timeout=FRAME_QUEUE_TIMEOUT)
+                self._notify_frame_ready(wake_fd)
+                return
+            except queue.Full:
+                if stop_event.is_set():
+                    return
+
+    def _process_frame_queue(self) -> None:
+        """Consume all frames produced so far by the pipeline worker thread and show
+        the latest one"""
+        # check before draining queue: a finished worker does not queue more frames
+        is_worker_done = self._pipeline_done.is_set()
+        has_new_frame = False
+        while True:
+            try:
+                frame = self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            # check if need to stop after fixed number of iterations
+            if self.num_iter and self._frame_num() >= self.num_iter:
+                continue  # drop extra frames produced before pipeline stopped
+            # save frame for playback, bounded memory: the oldest frame is dropped
+            if len(self._frames) == self._frames.maxlen:
+                self._frames_dropped += 1
+            self._frames.append(frame)
+            self._frame_idx = len(self._frames) - 1
+            has_new_frame = True
+            if self._frame_num() == 1:
+                self._init_progress()
+            if self.num_iter and self._frame_num() >= self.num_iter:
+                self.logger.info(f"Stopping pipeline after {self.num_iter} iterations")
+                self.stop_running_pipeline()
+
+        if has_new_frame:
+            # render img into screen output to Tkinter
             self._show_frame()
+            # update progress bar
+            self.tk_progress["value"] = self._frame_num() - 1
+            self.tk_lbl_frame_num["text"] = self._frame_num()
 
-        # update progress bar after each iteration
-        self.tk_progress["value"] = self._frame_idx
-        self.tk_lbl_frame_num["text"] = self._frame_idx + 1
+        if is_worker_done:
+            if self._pipeline_err:
+                self.pipeline_error(self._pipeline_err)
+            else:
+                self.run_pipeline_end()
 
-        # check if need to stop after fixed number of iterations
-        if self.num_iter and self._frame_idx + 1 >= self.num_iter:
-            self.logger.info(f"Stopping pipeline after {self.num_iter} iterations")
-            self.stop_running_pipeline()
+    def _init_progress(self) -> None:
+        """Set up progress bar based on total frame count of input.visual node"""
+        for node in self._pipeline.nodes:
+            if node.name.endswith("input.visual"):
+                num_frames = node.total_frame_count
+                if num_frames > 0:
+                    self.tk_progress["maximum"] = num_frames
+                else:
+                    self.tk_progress["mode"] = "indeterminate"
+
+    def _join_pipeline_worker(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pipeline worker thread to finish
+
+        Args:
+            timeout (Optional[float]): seconds to wait, None to wait until finished
+
+        Returns:
+            bool: True if worker has finished, False if still running after timeout
+        """
+        if self._pipeline_thread is not None:
+            self._pipeline_thread.join(timeout)
+            if self._pipeline_thread.is_alive():
+                return False
+            self._pipeline_thread = None
+        self._delete_frame_ready_pipe()
+        return True
 
     def run_pipeline_start(self) -> None:
         """Start PeekingDuck's pipeline"""
@@ -617,10 +1019,34 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             self._set_status_text(f"Pipeline: {self.pipeline_full_path}")
             self.is_pipeline_running = True
             self._enable_progress()
+            # technote: run pipeline in worker thread so that slow nodes do not
+            #           freeze the GUI, Tk widgets are only updated by main thread
+            self._frame_queue: "queue.Queue[bytes]" = queue.Queue(
+                maxsize=FRAME_QUEUE_SIZE
+            )
+            self._pipeline_stop = threading.Event()
+            self._pipeline_done = threading.Event()
+            self._pipeline_err: Optional[str] = None  # traceback from worker
+            self._node_input_keys: Dict[int, Tuple[int, Tuple[str, ...]]] = {}
+            self._exec_plan = self._make_exec_plan()
+            self._create_frame_ready_pipe()
+            self._pipeline_thread = threading.Thread(
+                target=self.run_pipeline_worker,
+                args=(
+                    self._pipeline,
+                    self._frame_queue,
+                    self._pipeline_stop,
+                    self._pipeline_done,
+                    self._frame_ready_pipe[1] if self._frame_ready_pipe else None,
+                ),
+                daemon=True,
+            )
+            self._pipeline_thread.start()
 
     def stop_running_pipeline(self) -> None:
         """Signal pipeline execution to be stopped"""
         self._pipeline.terminate = True
+        self._pipeline_stop.set()  # stop waiting for space in frame queue
 
     ###################
     #
@@ -636,18 +1062,32 @@ class Viewer:  # pylint: disable=too-many-instance-attributes, too-many-public-m
             self._update_slider_and_show_frame()
         self.set_viewer_state_to_play()
         self._set_header_playing()
+        self._playback_deadline = perf_counter()
         self.do_playback()
 
     def do_playback(self) -> None:
-        """Playback saved video frames: to be called continuously"""
+        """Playback saved video frames: schedules itself to be called once per frame
+        interval until the last frame"""
+        self._playback_job = None
         if self._forward_one_frame():
-            self.tk_scale.set(self._frame_idx + 1)
+            # schedule against a running deadline so time spent showing the frame
+            # does not accumulate as drift, but do not burst to catch up if late
+            now = perf_counter()
+            interval = self._playback_interval / 1000
+            self._playback_deadline = max(self._playback_deadline + interval, now)
+            delay = int((self._playback_deadline - now) * 1000)
+            self._playback_job = self.root.after(delay, self.do_playback)
         else:
             self.stop_playback()
 
     def stop_playback(self) -> None:
         """Stop output playback"""
+        if self._playback_job:
+            self.root.after_cancel(self._playback_job)
+            self._playback_job = None
         self.is_output_playback = False
+        if self._frames:
+            self._update_slider()  # slider updates are throttled during playback
         self.set_viewer_state_to_stop()
         self._set_header_stop()
 
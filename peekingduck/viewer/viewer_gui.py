@@ -30,7 +30,7 @@ PeekingDuck Viewer GUI Creation Code
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk
-from peekingduck.viewer.viewer_utils import load_image
+from peekingduck.viewer.viewer_utils import load_image, set_grid_columns_weight
 from peekingduck.viewer.single_column_view import SingleColumnPlayListView
 
 LOGO: str = "PeekingDuckLogo.png"
@@ -76,7 +76,6 @@ def create_window(viewer) -> None:  # type: ignore
     root.bind("<Key>", viewer.on_keypress)
     root.geometry(f"{WIN_WIDTH}x{WIN_HEIGHT}")
     root.minsize(MIN_WIDTH, MIN_HEIGHT)
-    root.update()  # force update before mainloop() to get correct size
     viewer.root = root  # save main window
     # Tk technotes: Need to create footer before body to ensure footer controls do not
     #               get covered when image is zoomed in
@@ -84,7 +83,6 @@ def create_window(viewer) -> None:  # type: ignore
     create_header(viewer)
     create_footer(viewer)
     create_body(viewer)
-    viewer.btn_hide_show_playlist_press()  # first toggle to hide playlist
 
 
 def create_header(viewer) -> None:  # type: ignore
@@ -106,9 +104,7 @@ def create_header(viewer) -> None:  # type: ignore
     lbl = tk.Label(header_frm, text="Viewer Header", font=("TkFixedFont 16"))
     lbl.grid(row=1, column=0, sticky="nsew")
     viewer.tk_header = lbl
-    num_col, _ = header_frm.grid_size()  # config column sizes
-    for i in range(num_col):
-        header_frm.grid_columnconfigure(i, weight=1)
+    set_grid_columns_weight(header_frm)  # config column sizes
 
 
 def create_footer(viewer) -> None:  # type: ignore
@@ -120,24 +116,19 @@ def create_footer(viewer) -> None:  # type: ignore
     footer_frm = ttk.Frame(viewer.root, name="footer_frm")
     footer_frm.pack(side=tk.BOTTOM, fill=tk.X)
     viewer.tk_footer_frm = footer_frm
-    # row 0: spacer
-    lbl = tk.Label(footer_frm)  # row spacer
-    lbl.grid(row=0, column=0)
-    # row 1: controls
+    # Tk technotes: controls and status bar are padded above and below by the height
+    #               of a text line, instead of using empty labels as row spacers
+    lbl = tk.Label(footer_frm, anchor=tk.CENTER, text="Status bar text")
+    row_pad = lbl.winfo_reqheight()
+    # row 0: controls
     ctrl_frm = ttk.Frame(footer_frm, name="ctrl_frm")
-    ctrl_frm.grid(row=1, column=0, sticky="ew")
+    ctrl_frm.grid(row=0, column=0, sticky="ew", pady=(row_pad, 0))
     _create_controls(viewer, ctrl_frm)
-    # row 2: status bar
-    lbl = tk.Label(footer_frm, anchor=tk.CENTER, text="Status bar text")
-    lbl.grid(row=2, column=0, sticky="ew")
+    # row 1: status bar
+    lbl.grid(row=1, column=0, sticky="ew", pady=(0, row_pad))
     viewer.tk_status_bar = lbl
-    # row 3: spacer
-    lbl = tk.Label(footer_frm)  # row spacer
-    lbl.grid(row=3, column=0)
 
-    num_col, _ = footer_frm.grid_size()  # config column sizes
-    for i in range(num_col):
-        footer_frm.grid_columnconfigure(i, weight=1)
+    set_grid_columns_weight(footer_frm)  # config column sizes
 
 
 def create_side_margins(viewer) -> None:  # type: ignore
@@ -177,18 +168,12 @@ def create_body(viewer) -> None:  # type: ignore
     lbl.pack(side=tk.TOP)
     lbl = tk.Label(panel_frm)
     lbl.pack(side=tk.BOTTOM)
-    # playlist
+    # playlist: hidden on startup, its view is created when first shown
+    #           (cf. create_playlist_view)
     playlist_frm = ttk.Frame(panel_frm, name="playlist_frm")
-    playlist_frm.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
     viewer.tk_playlist_frm = playlist_frm
-    playlist_view = SingleColumnPlayListView(
-        playlist=viewer.playlist, root=playlist_frm
-    )
-    viewer.tk_playlist_view = playlist_view
-    playlist_view.register_callback("add", viewer.on_add_pipeline)
-    playlist_view.register_callback("delete", viewer.on_delete_pipeline)
-    playlist_view.register_callback("run", viewer.on_run_pipeline)
-    viewer.playlist_show = True
+    viewer.tk_playlist_view = None
+    viewer.playlist_show = False
 
     # video image
     image_frm = ttk.Frame(body_frm, name="image_frm")
@@ -199,6 +184,21 @@ def create_body(viewer) -> None:  # type: ignore
     viewer.tk_output_image = output_image
 
 
+def create_playlist_view(viewer) -> None:  # type: ignore
+    """Create playlist view in side panel
+
+    Args:
+        viewer (Viewer): PeekingDuck Viewer object
+    """
+    playlist_view = SingleColumnPlayListView(
+        playlist=viewer.playlist, root=viewer.tk_playlist_frm
+    )
+    viewer.tk_playlist_view = playlist_view
+    playlist_view.register_callback("add", viewer.on_add_pipeline)
+    playlist_view.register_callback("delete", viewer.on_delete_pipeline)
+    playlist_view.register_callback("run", viewer.on_run_pipeline)
+
+
 def _create_controls(viewer, ctrl_frm: ttk.Frame) -> None:  # type: ignore
     """Create 3 rows of controls: slider/progress bar/buttons
 
@@ -265,6 +265,4 @@ def _create_controls(viewer, ctrl_frm: ttk.Frame) -> None:  # type: ignore
     lbl = tk.Label(ctrl_frm, text="          ")
     lbl.grid(row=2, column=95, columnspan=BTN_WIDTH_SPAN, sticky="nsew")
 
-    num_col, _ = ctrl_frm.grid_size()  # config column sizes
-    for i in range(num_col):
-        ctrl_frm.grid_columnconfigure(i, weight=1)
+    set_grid_columns_weight(ctrl_frm)  # config column sizes
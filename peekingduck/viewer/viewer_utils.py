@@ -14,8 +14,12 @@
 
 """Utility helper methods for PeekingDuck Viewer"""
 
+import functools
+import tkinter as tk
 from PIL import ImageTk, Image
 
+KEY_STATE_CTRL: int = 0x4  # Control modifier bit in Tk key event state
+
 
 def get_keyboard_char(char: str, keysym: str) -> str:
     """Get keyboard character
@@ -62,22 +66,42 @@ def get_keyboard_modifier(state: int) -> str:
             0x20000: 'Alt'              ,   #not a typo
         }
     """
-    ctrl = (state & 0x4) != 0
+    ctrl = (state & KEY_STATE_CTRL) != 0
     alt = (state & 0x8) != 0 or (state & 0x80) != 0
     shift = (state & 0x1) != 0
     res = f"{'ctrl' if ctrl else ''}{'-alt' if alt else ''}{'-shift' if shift else ''}"
     return "" if len(res) == 0 else res[1:] if res[0] == "-" else res
 
 
-def load_image(image_path: str, resize_pct: float = 1.0) -> ImageTk.PhotoImage:
-    """Load and resize an image, 'coz plain vanilla Tkinter doesn't support JPG, PNG
+def set_grid_columns_weight(frame: tk.Widget, weight: int = 1) -> None:
+    """Set the same weight for all grid columns of given frame, so that columns
+    share extra space equally
 
     Args:
-        resize_pct (float, optional): percentage to resize.
-                                      Defaults to original size 1.0.
+        frame (tk.Widget): frame containing gridded widgets
+        weight (int): column weight, defaults to 1
+
+    Tk technotes:
+        grid columnconfigure accepts a list of column indices, so all columns are
+        configured in one Tk call instead of one call per column
+    """
+    num_col, _ = frame.grid_size()
+    if num_col > 0:
+        frame.grid_columnconfigure(tuple(range(num_col)), weight=weight)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_resized_image(image_path: str, resize_pct: float) -> Image.Image:
+    """Load and resize an image, memoized as images are static assets.
+    Caches the PIL image rather than the Tk PhotoImage, as the latter is bound to
+    the Tk root window it is created for.
+
+    Args:
+        image_path (str): path of image file
+        resize_pct (float): percentage to resize
 
     Returns:
-        ImageTk.PhotoImage: the loaded image
+        Image.Image: the loaded image
     """
     img = Image.open(image_path)
     if resize_pct != 1.0:
@@ -85,6 +109,21 @@ def load_image(image_path: str, resize_pct: float = 1.0) -> ImageTk.PhotoImage:
         height = int(resize_pct * img.size[1])
         resized_img = img.resize((width, height))
     else:
+        img.load()
         resized_img = img
+    return resized_img
+
+
+def load_image(image_path: str, resize_pct: float = 1.0) -> ImageTk.PhotoImage:
+    """Load and resize an image, 'coz plain vanilla Tkinter doesn't support JPG, PNG
+
+    Args:
+        resize_pct (float, optional): percentage to resize.
+                                      Defaults to original size 1.0.
+
+    Returns:
+        ImageTk.PhotoImage: the loaded image
+    """
+    resized_img = _load_resized_image(image_path, resize_pct)
     the_img = ImageTk.PhotoImage(resized_img)
     return the_img
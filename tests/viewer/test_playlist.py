@@ -0,0 +1,105 @@
+# Copyright 2022 AI Singapore
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+import yaml
+
+from peekingduck.viewer.playlist import PKD_CONFIG_DIR, PKD_PLAYLIST_FILE, PlayList
+
+OLD_MTIME_NS = 1_000_000_000_000_000_000  # fixed past mtime to detect rewrites
+
+
+@pytest.fixture
+def playlist_path(tmp_path):
+    return tmp_path / PKD_CONFIG_DIR / PKD_PLAYLIST_FILE
+
+
+def write_playlist_file(playlist_path, pipelines):
+    playlist_path.parent.mkdir(exist_ok=True)
+    with open(playlist_path, "w") as outfile:
+        yaml.safe_dump({"playlist": pipelines}, outfile)
+    os.utime(playlist_path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def read_playlist_file(playlist_path):
+    with open(playlist_path) as infile:
+        return yaml.safe_load(infile)["playlist"]
+
+
+class TestPlayList:
+    def test_save_unchanged_playlist_does_not_write_file(self, tmp_path, playlist_path):
+        write_playlist_file(playlist_path, ["/pipelines/a.yml", "/pipelines/b.yml"])
+        playlist = PlayList(tmp_path)
+        playlist.add_pipeline("/pipelines/a.yml")  # already in playlist
+        playlist.delete_pipeline("/pipelines/c.yml")  # not in playlist
+        playlist.save_playlist_file()
+
+        assert playlist_path.stat().st_mtime_ns == OLD_MTIME_NS
+
+    def test_save_empty_playlist_does_not_create_file(self, tmp_path, playlist_path):
+        playlist = PlayList(tmp_path)
+        playlist.save_playlist_file()
+
+        assert not playlist_path.exists()
+
+    def test_save_after_add_pipeline(self, tmp_path, playlist_path):
+        write_playlist_file(playlist_path, ["/pipelines/a.yml"])
+        playlist = PlayList(tmp_path)
+        playlist.add_pipeline("/pipelines/b.yml")
+        playlist.save_playlist_file()
+
+        assert read_playlist_file(playlist_path) == [
+            "/pipelines/a.yml",
+            "/pipelines/b.yml",
+        ]
+        assert not playlist_path.with_suffix(".tmp").exists()
+
+    def test_save_after_delete_pipeline(self, tmp_path, playlist_path):
+        write_playlist_file(playlist_path, ["/pipelines/a.yml", "/pipelines/b.yml"])
+        playlist = PlayList(tmp_path)
+        playlist.delete_pipeline("/pipelines/a.yml")
+        playlist.save_playlist_file()
+
+        assert read_playlist_file(playlist_path) == ["/pipelines/b.yml"]
+        assert not playlist_path.with_suffix(".tmp").exists()
+
+    def test_save_again_after_save_does_not_write_file(self, tmp_path, playlist_path):
+        playlist = PlayList(tmp_path)
+        playlist.add_pipeline("/pipelines/a.yml")
+        playlist.save_playlist_file()
+        os.utime(playlist_path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        playlist.save_playlist_file()
+
+        assert playlist_path.stat().st_mtime_ns == OLD_MTIME_NS
+
+    def test_load_drops_duplicate_pipelines(self, tmp_path, playlist_path):
+        write_playlist_file(
+            playlist_path,
+            ["/pipelines/a.yml", "/pipelines/b.yml", "/pipelines/a.yml"],
+        )
+        playlist = PlayList(tmp_path)
+
+        assert len(playlist) == 2
+        assert [stats.pipeline for stats in playlist] == [
+            "/pipelines/a.yml",
+            "/pipelines/b.yml",
+        ]
+
+    def test_pipelines_sort_in_natural_order(self, tmp_path, playlist_path):
+        write_playlist_file(playlist_path, ["/pipelines/p10.yml", "/pipelines/P2.yml"])
+        playlist = PlayList(tmp_path)
+
+        assert [stats.name for stats in sorted(playlist)] == ["P2.yml", "p10.yml"]